@@ -1,9 +1,78 @@
-import heapq
 import numpy as np
-import uuid
 
 from enum import Enum
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
+
+# Number of packed uint64 words (32 KB) processed per block when spawning a
+# batch of children. Blocking along the gene axis keeps the parent slices
+# resident in L1 cache while every child's values for that block are
+# produced, instead of re-streaming whole parents once per child.
+_SPAWN_BLOCK_WORDS = 4096
+
+# Numba is optional; when it is unavailable the evolvers fall back to pure
+# NumPy implementations of the batched spawn path.
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+# CUDA support is similarly optional and only used when a device is present.
+_HAS_CUDA = False
+if _HAS_NUMBA:
+    try:
+        from numba import cuda
+        from numba.cuda.random import (create_xoroshiro128p_states,
+                                       xoroshiro128p_next)
+        _HAS_CUDA = cuda.is_available()
+    except ImportError:
+        pass
+
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _spawn_batch(p1, p2, out, vec_size, mut_prob):
+        """Fills `out` with children of `p1`/`p2` via uniform crossover and
+            bit-flip mutation on packed uint64 words.
+
+        Children are produced in parallel, one thread per child, with
+        numba's per-thread RNG, avoiding the mask allocations the NumPy
+        path pays per batch.
+        """
+        n, words = out.shape
+        for c in prange(n):
+            for w in range(words):
+                # Assemble a 64 bit crossover mask from two 32 bit draws.
+                hi = np.uint64(np.random.randint(0, 2 ** 32))
+                lo = np.uint64(np.random.randint(0, 2 ** 32))
+                mask = (hi << np.uint64(32)) | lo
+                out[c, w] = (p1[w] & mask) | (p2[w] & ~mask)
+
+            k = np.random.binomial(vec_size, mut_prob)
+            for _ in range(k):
+                idx = np.random.randint(0, vec_size)
+                out[c, idx >> 6] ^= np.uint64(1) << np.uint64(idx & 63)
+
+
+if _HAS_CUDA:
+    @cuda.jit
+    def _cuda_spawn_kernel(rng_states, p1, p2, out):
+        """Computes the uniform crossover of `p1`/`p2` into `out` on the
+            device, one thread per packed uint64 word per child.
+
+        Both parents are read coalesced from device memory and each thread
+        draws its 64 bit crossover mask from a per-thread xoroshiro128p
+        state.
+        """
+        i = cuda.grid(1)
+        words = p1.shape[0]
+        if i < out.shape[0] * words:
+            c = i // words
+            w = i - c * words
+            mask = xoroshiro128p_next(rng_states, i)
+            out[c, w] = (p1[w] & mask) | (p2[w] & ~mask)
+
 
 class CrossoverType(Enum):
     """A enum defining different crossover operations within a genetic algorthim."""
@@ -11,16 +80,36 @@ class CrossoverType(Enum):
 
 class MutationType(Enum):
     """A enum defining different mutation operations for a genetic algorithm."""
-    FLIP_BIT = 1 
+    FLIP_BIT = 1
+
+class SelectionType(Enum):
+    """A enum defining how parents are selected from a generation."""
+
+    # Keep only the num_parents highest priority children.
+    TRUNCATION = 1
+
+    # Sample tournament_size children per parent slot and take the best.
+    TOURNAMENT = 2
 
 
 class VectorEvolver():
-    """A class for evolving a vector using a genetic algorithm."""
+    """A class for evolving a 0/1 vector using a genetic algorithm.
 
-    def __init__(self, 
-                 size: int, 
-                 crossover_type: CrossoverType, 
-                 mutation_type: MutationType):
+    The genome is stored bit-packed, 64 genes per np.uint64 word, so that
+    crossover and mutation operate on whole words with bulk bitwise
+    operations rather than touching one int per gene. Use `pack` and
+    `unpack` to convert between the packed representation and flat 0/1
+    arrays.
+    """
+
+    def __init__(self,
+                 size: int,
+                 crossover_type: CrossoverType,
+                 mutation_type: MutationType,
+                 seed: Optional[int] = None,
+                 dtype=np.uint8,
+                 selection_type: SelectionType = SelectionType.TRUNCATION,
+                 tournament_size: int = 2):
         """Vector Evolver Ctor.
 
         Args:
@@ -29,32 +118,92 @@ class VectorEvolver():
                 offspring.
             mutation_type: The type of mutation operation used to produce new
                 offspring.
+            seed: An optional seed for the random generator, for reproducible
+                runs. Seeded evolvers skip the parallel numba spawn kernel,
+                whose per-thread RNG cannot be made deterministic, and use
+                the vectorized NumPy path instead.
+            dtype: The dtype of the 0/1 gene arrays produced by `unpack`. The
+                uint8 default comes straight out of np.unpackbits with no
+                extra copy and keeps downstream elementwise operations on the
+                genes in narrow SIMD-friendly lanes.
+            selection_type: How parents are selected from each generation.
+            tournament_size: The number of children sampled per parent slot
+                when using tournament selection.
         """
         self._vec_size = size
+        self._vec_words = (size + 63) // 64
+        self._dtype = np.dtype(dtype)
         self.crossover_type = crossover_type
         self.mutation_type = mutation_type
 
-        # Stores children of the current parents by their unique Ids.
-        self._child_dict = {}
-        
-        # Min heap containing priorities and the corresponding uuids of 
-        # children in the current generation.
-        self._child_heap = []
-        heapq.heapify(self._child_heap)
-
-        self._generation = 0    
-        self._generation_priorities = []
+        # The crossover and mutation types cannot change after construction,
+        # so resolve each to its implementation once here rather than
+        # branching on the type in every call. New operation types are
+        # supported by registering them in these tables.
+        self.crossover = {
+            CrossoverType.UNIFORM: self._crossover_uniform,
+        }[crossover_type]
+        self.mutate = {
+            MutationType.FLIP_BIT: self._mutate_flip_bit,
+        }[mutation_type]
+
+        # All random draws go through one PCG64 Generator, which avoids the
+        # locking overhead of the legacy global RandomState. (The optional
+        # numba kernels use numba's own per-thread RNG instead, so seeded
+        # evolvers stay off them to honor the reproducibility contract.)
+        self._rng = np.random.default_rng(seed)
+        self._seeded = seed is not None
+
+        self._generation = 0
+
+        # Running priority statistics for the current generation, updated as
+        # children are added so reporting never has to revisit them.
+        self._priority_count = 0
+        self._priority_sum = 0.0
+        self._priority_sumsq = 0.0
+
+        # Raw priorities of the current generation, kept in a preallocated
+        # float64 buffer (grown geometrically) rather than a Python list so
+        # appends are unboxed stores. `_priority_count` is the write cursor.
+        self._generation_priorities = np.empty(64, dtype=np.float64)
 
         # TODO(ameade): Consider parametrizing the number of parents and
         # allowing for off-spring to be created by multiple parents.
         self._num_parents = 2
+
+        self._selection_type = selection_type
+        self._tournament_size = tournament_size
+
+        # Truncation selection retains only the num_parents highest priority
+        # children to prevent excessive memory usage; tournament selection
+        # instead stores every child of the generation in a preallocated
+        # buffer (grown geometrically) that parents are later sampled from.
+        self._top_priorities = np.full(self._num_parents, -np.inf)
+        self._top_children = [None] * self._num_parents
+        if selection_type == SelectionType.TOURNAMENT:
+            self._children = np.empty(
+                (self._generation_priorities.size, self._vec_words),
+                dtype=np.uint64)
+        else:
+            self._children = None
+
         self._parents = [self.init_child() for i in range(self._num_parents)]
 
-    
+        # Output buffer for spawn_children, allocated lazily and reused
+        # across generations so spawning a batch performs no per-generation
+        # allocation.
+        self._spawn_buf = None
+
+        # Device-side buffers for cuda_spawn_children, allocated lazily and
+        # reused across generations.
+        self._cuda_out = None
+        self._cuda_rng_states = None
+
+
     # TODO(ameade) create a child class to allow typing enforcement.
-    def add_child(self, child, priority: float) -> uuid.UUID:
+    def add_child(self, child, priority: float) -> Optional[int]:
         """Adds a child to the current generation with a given priority.
-        
+
         Args:
             child: A child entry object.
             priority: A priority corresponding to the given child. A higher
@@ -62,124 +211,346 @@ class VectorEvolver():
                 next generation.
 
         Returns:
-            The UUID of the newly added child.
+            The index of the parent slot the child was retained in, or None
+            if the child was outranked by the retained children.
 
         """
 
-        # UUIDs are used to track children.
-        cid = uuid.uuid1()
-        self._child_dict[cid] = child
-        entry = [priority, cid]
-        
-        if len(self._child_heap) >= self._num_parents:
-            # To prevent excessive memory usage only retain enough child to
-            # select a new generation of parents.
-            heapq.heapreplace(self._child_heap, entry)
+        slot = None
+
+        if self._selection_type == SelectionType.TOURNAMENT:
+            # Store every child; selection happens in update_parents.
+            if self._priority_count == self._children.shape[0]:
+                self._children = np.resize(
+                    self._children, (self._children.shape[0] * 2,
+                                     self._vec_words))
+            slot = self._priority_count
+            self._children[slot] = child
 
         else:
-            heapq.heappush(self._child_heap, entry)
-        
-        # Save priority for reporting stats later.
-        self._generation_priorities.append(priority)
-        return cid
+            # Displace the lowest priority retained child if this one
+            # outranks it. For the typical small num_parents a linear argmin
+            # is cheaper than any heap bookkeeping.
+            min_slot = int(np.argmin(self._top_priorities))
+            if priority > self._top_priorities[min_slot]:
+                self._top_priorities[min_slot] = priority
+                # Copy, since the child may be a view into the spawn buffer
+                # that the next spawn call overwrites.
+                self._top_children[min_slot] = np.array(child, copy=True)
+                slot = min_slot
+
+        # Record the raw priority and fold it into the running stats for
+        # reporting later.
+        if self._priority_count == self._generation_priorities.size:
+            self._generation_priorities = np.resize(
+                self._generation_priorities,
+                self._generation_priorities.size * 2)
+        self._generation_priorities[self._priority_count] = priority
+        self._priority_count += 1
+        self._priority_sum += priority
+        self._priority_sumsq += priority * priority
+        return slot
 
 
     def spawn_child(self):
         """Creates a new child by applying mutations and crossovers to parents.
 
-        Returns: 
-            A new child object that has been evolved from its parents.
-            
+        Returns:
+            A new child object that has been evolved from its parents. The
+            child is a view into a reused buffer that the next spawn call
+            overwrites; add_child copies it when retaining it.
+
+        """
+        return self.spawn_children(1)[0]
+
+    def spawn_children(self, n: int):
+        """Creates a batch of children by applying crossovers and mutations to
+            the parents with vectorized operations.
+
+        Producing a whole generation in one call replaces the per-child
+        crossover/mutate round-trips with a couple of bulk NumPy operations
+        over an (n, vec_size) array.
+
+        Args:
+            n: The number of children to create.
+
+        Returns:
+            An np.ndarray of shape (n, vec_words) of packed uint64 words where
+            each row is a new child vector evolved from the parents. The
+            array is a persistent buffer that the next spawn call overwrites,
+            so callers retaining a child beyond that must copy it (add_child
+            already does).
+
+        """
+        out = self._spawn_out(n)
+
+        if (_HAS_NUMBA
+                and not self._seeded
+                and self.crossover_type == CrossoverType.UNIFORM
+                and self.mutation_type == MutationType.FLIP_BIT):
+            _spawn_batch(self._parents[0], self._parents[1], out,
+                         self._vec_size, 1 / self._vec_size)
+            return out
+
+        children = out
+        children[:] = self._parents[0]
+
+        if self.crossover_type == CrossoverType.UNIFORM:
+            p2 = self._parents[1]
+            # Work block-by-block along the gene axis so the parent slices
+            # stay cache resident while all n children are filled in. Each
+            # word of the mask supplies 64 independent crossover bits, and
+            # the in-place ops keep the mask as the only temporary.
+            for j0 in range(0, self._vec_words, _SPAWN_BLOCK_WORDS):
+                j1 = min(j0 + _SPAWN_BLOCK_WORDS, self._vec_words)
+                mask = self._rng.integers(0, 2 ** 64, size=(n, j1 - j0),
+                                          dtype=np.uint64)
+                children[:, j0:j1] &= mask
+                np.invert(mask, out=mask)
+                mask &= p2[j0:j1]
+                children[:, j0:j1] |= mask
+
+        return self._mutate_children(children)
+
+    def _spawn_out(self, n: int):
+        """Gets the reusable (n, vec_words) output buffer for spawning,
+            reallocating only when the batch size changes."""
+
+        if self._spawn_buf is None or self._spawn_buf.shape[0] != n:
+            self._spawn_buf = np.empty((n, self._vec_words), dtype=np.uint64)
+        return self._spawn_buf
+
+    def _mutate_children(self, children):
+        """Applies the configured mutation in place to a batch of children.
+
+        Args:
+            children: An (n, vec_words) np.ndarray of packed child vectors.
+
+        Returns:
+            The mutated batch.
+
         """
-        return self.mutate(self.crossover(self._parents[0], 
-                                          self._parents[1]))   
+
+        if self.mutation_type == MutationType.FLIP_BIT:
+            # Rather than sampling vec_size uniforms per child, draw the
+            # number of flips per child (expected value 1) and only set those
+            # bits in the flip mask.
+            n = children.shape[0]
+            counts = self._rng.binomial(self._vec_size, 1 / self._vec_size,
+                                        size=n)
+            idx = self._rng.integers(0, self._vec_size, size=counts.sum())
+            rows = np.repeat(np.arange(n), counts)
+            # bitwise_xor.at accumulates duplicate indices, so two flips
+            # landing in the same word of the same child both apply (a plain
+            # fancy-indexed ^= would silently drop one).
+            np.bitwise_xor.at(children, (rows, idx >> 6),
+                              np.uint64(1) << (idx & 63).astype(np.uint64))
+
+        return children
+
+    def cuda_spawn_children(self, n: int):
+        """Creates a batch of children with crossover performed on the GPU.
+
+        For large genomes the crossover is memory bandwidth bound on the
+        CPU, so the word-level uniform crossover runs as a CUDA kernel over
+        the packed parent vectors. The sparse bit-flip mutation touches
+        O(n) bits in total and is applied on the host after the copy back.
+        Device buffers are reused across generations when the batch size is
+        unchanged.
+
+        Args:
+            n: The number of children to create.
+
+        Returns:
+            An np.ndarray of shape (n, vec_words) of packed uint64 words
+            where each row is a new child vector evolved from the parents.
+
+        """
+
+        if not _HAS_CUDA or self.crossover_type != CrossoverType.UNIFORM:
+            # Call the base implementation directly so subclass overrides of
+            # spawn_children do not re-wrap the fallback result.
+            return VectorEvolver.spawn_children(self, n)
+
+        threads_per_block = 256
+        blocks = (n * self._vec_words + threads_per_block - 1) \
+            // threads_per_block
+
+        if self._cuda_out is None or self._cuda_out.shape[0] != n:
+            self._cuda_out = cuda.device_array((n, self._vec_words),
+                                               dtype=np.uint64)
+            self._cuda_rng_states = create_xoroshiro128p_states(
+                blocks * threads_per_block,
+                seed=int(self._rng.integers(0, 2 ** 63)))
+
+        d_p1 = cuda.to_device(self._parents[0])
+        d_p2 = cuda.to_device(self._parents[1])
+        _cuda_spawn_kernel[blocks, threads_per_block](
+            self._cuda_rng_states, d_p1, d_p2, self._cuda_out)
+
+        return self._mutate_children(self._cuda_out.copy_to_host())
 
     def update_parents(self):
         """Updates `self._parents by selecting the parents from the current
             generation of children."""
-        
-        # Since we are using a Min heap we select the parents based on those
-        # with the highest priority and then recreate the heap.
-        parents_cid = heapq.nlargest(self._num_parents, self._child_heap)
-        self._parents = []
-        for priority, pcid in parents_cid:
-            self._parents.append(self._child_dict[pcid])
-        
+
+        if self._selection_type == SelectionType.TOURNAMENT:
+            # Sample tournament_size contenders per parent slot and promote
+            # the highest priority contender from each tournament.
+            fitness = self._generation_priorities[:self._priority_count]
+            idx = self._rng.integers(0, self._priority_count,
+                                     size=(self._num_parents,
+                                           self._tournament_size))
+            winners = idx[np.arange(self._num_parents),
+                          np.argmax(fitness[idx], axis=1)]
+            # Copy, since the child buffer is overwritten next generation.
+            self._parents = [self._children[w].copy() for w in winners]
+
+        else:
+            # The highest priority children were tracked as they were added,
+            # so selection is just promoting them to parents.
+            self._parents = list(self._top_children)
+
         # Reset Evolver.
-        self._child_dict = {}
-        self._child_heap = []
-        heapq.heapify(self._child_heap)
-        self._generation_priorities = []
+        self._top_priorities.fill(-np.inf)
+        self._top_children = [None] * self._num_parents
+        self._priority_count = 0
+        self._priority_sum = 0.0
+        self._priority_sumsq = 0.0
         self._generation += 1
 
     def get_generation_stats(self) -> Dict[str, float]:
         """Gets a dictionary of statistics summarizing the current
         generation.
-        
+
+        The statistics come from running accumulators maintained by
+        `add_child`, so no per-child data is traversed or converted here.
+
         Returns:
             A dictionary containing metric names and values.
-        
+
         """
+        if self._priority_count == 0:
+            return {
+                'generation': self._generation,
+                'mean': float('nan'),
+                'std': float('nan')}
+
+        # The running sums make both statistics O(1) regardless of how many
+        # children the generation contained.
+        mean = self._priority_sum / self._priority_count
+        var = max(0.0, self._priority_sumsq / self._priority_count
+                  - mean * mean)
         return {
             'generation': self._generation,
-            'mean': round(np.mean(self._generation_priorities), 2),
-            'std': round(np.std(self._generation_priorities), 2)}
+            'mean': round(mean, 2),
+            'std': round(np.sqrt(var), 2)}
+
+    def get_generation_priorities(self) -> np.ndarray:
+        """Gets the raw priorities of the current generation's children.
+
+        Returns:
+            A view into the priority buffer containing one entry per child
+            added since the last `update_parents` call, in insertion order.
+
+        """
+        return self._generation_priorities[:self._priority_count]
 
     def init_child(self):
         """Intializes a random new child vector.
-        
+
         Returns:
-            An np.ndarray.
-            
+            An np.ndarray of packed uint64 words.
+
         """
-        return np.random.randint(low=0, high=1, size=self._vec_size)
+        # Every word is drawn over the full uint64 range so each gene starts
+        # as an independent fair coin flip.
+        return self._rng.integers(low=0, high=2 ** 64, size=self._vec_words,
+                                  dtype=np.uint64)
+
+    def pack(self, bits):
+        """Packs a flat 0/1 array into the internal uint64 word
+            representation.
+
+        Args:
+            bits: A length vec_size array of 0/1 gene values.
+
+        Returns:
+            An np.ndarray of packed uint64 words.
+
+        """
+
+        packed_bytes = np.packbits(np.asarray(bits, dtype=np.uint8).ravel(),
+                                   bitorder='little')
+        buf = np.zeros(self._vec_words * 8, dtype=np.uint8)
+        buf[:packed_bytes.size] = packed_bytes
+        return buf.view(np.uint64)
+
+    def unpack(self, vec):
+        """Unpacks a uint64 word vector into a flat 0/1 array.
+
+        Args:
+            vec: An np.ndarray of packed uint64 words.
+
+        Returns:
+            A length vec_size np.ndarray of gene values with the evolver's
+            configured dtype.
+
+        """
+
+        bits = np.unpackbits(vec.view(np.uint8), count=self._vec_size,
+                             bitorder='little')
+        if self._dtype != np.uint8:
+            bits = bits.astype(self._dtype)
+        return bits
+
+    def _crossover_uniform(self, p1, p2):
+        """Performs a uniform crossover combining two parents to produce
+            a new child. Bound to `self.crossover` at construction.
 
-    def crossover(self, p1, p2):
-        """Performs a crossover operation combining two parents to produce
-            a new child.
-        
         Args:
             p1: The first parent vector to crossover.
             p2: The second parent vector to crossover.
-                
+
         Returns:
             A new child vector containing a random combination of the two
             parents.
 
         """
 
-        c = np.copy(p1)
+        mask = self._rng.integers(0, 2 ** 64, size=self._vec_words,
+                                  dtype=np.uint64)
+        return (p1 & mask) | (p2 & ~mask)
 
-        if self.crossover_type == CrossoverType.UNIFORM:
-            crossover_bits = np.random.rand(self._vec_size) < 0.5 
-            c[crossover_bits] = p2[crossover_bits]
-        
-        return c
+    def _mutate_flip_bit(self, p):
+        """Mutates a vector by flipping random bits. Bound to `self.mutate`
+            at construction.
 
-    def mutate(self, p):
-        """Mutates a vector to alter it from its original state.
-        
         Args:
-            p: The vector to mutate.
-        
+            p: The vector to mutate, modified in place.
+
         Returns:
             The newly altered vector.
         """
-        
-        if self.mutation_type == MutationType.FLIP_BIT:
-            mutation_bits = np.random.rand(self._vec_size) < (1 / self._vec_size)
-            p[mutation_bits] = 1 - p[mutation_bits]
 
+        # The expected number of flips is 1, so sample how many occur and XOR
+        # only those bits instead of drawing vec_size uniforms. The sparse
+        # sampling is shared with the batched spawn paths.
+        self._mutate_children(p.reshape(1, self._vec_words))
         return p
 
 
 class MatrixEvolver(VectorEvolver):
     """A class to evolve matrices using genetic algorithims."""
     
-    def __init__(self, 
+    def __init__(self,
                  sizes: Iterable[Iterable[int]],
                  crossover_type: CrossoverType,
-                 mutation_type: MutationType):
+                 mutation_type: MutationType,
+                 seed: Optional[int] = None,
+                 dtype=np.uint8,
+                 selection_type: SelectionType = SelectionType.TRUNCATION,
+                 tournament_size: int = 2):
         """Matrix Evolver Ctor.
 
         Args:
@@ -188,12 +559,25 @@ class MatrixEvolver(VectorEvolver):
                 offspring.
             mutation_type: The type of mutation operation used to produce new
                 offspring.
+            seed: An optional seed for the random generator, for reproducible
+                runs.
+            dtype: The dtype of the matrices produced by `vec_to_matrices`.
+            selection_type: How parents are selected from each generation.
+            tournament_size: The number of children sampled per parent slot
+                when using tournament selection.
         """
         
         self._matrix_sizes = sizes
-        self._matrix_params = [np.product(s) for s in self._matrix_sizes]
+        self._matrix_params = [np.prod(s) for s in self._matrix_sizes]
         self._total_params = np.sum(self._matrix_params)
-        super().__init__(self._total_params, crossover_type, mutation_type)
+
+        # Start offset of each matrix within the flat gene vector.
+        self._offsets = np.cumsum([0] + self._matrix_params)
+
+        super().__init__(self._total_params, crossover_type, mutation_type,
+                         seed=seed, dtype=dtype,
+                         selection_type=selection_type,
+                         tournament_size=tournament_size)
 
     def vec_to_matrices(self, vec):
         """ Converts a vector to matrices whose size is defined by self.sizes.
@@ -202,20 +586,20 @@ class MatrixEvolver(VectorEvolver):
             vec: The vector to convert to matrices.
                 
         Returns:
-            The set of matrices reshaped from vec.
+            The set of matrices reshaped from vec. The matrices are views
+            into a single flat buffer of unpacked gene values, so modifying
+            one modifies the shared buffer.
 
         """
 
-        matrices = []
-        idx = 0
-        for i, s in enumerate(self._matrix_params):
-            m = np.zeros(s)
-            m[:] = vec[idx : idx + s]
-            m = m.reshape(self._matrix_sizes[i])
-            matrices.append(m)
-            idx += s
+        bits = self.unpack(vec)
 
-        return matrices
+        # Reshaping contiguous slices yields views, so beyond the unpack no
+        # gene values are copied.
+        return [
+            bits[self._offsets[i] : self._offsets[i + 1]].reshape(
+                self._matrix_sizes[i])
+            for i in range(len(self._matrix_sizes))]
 
     def matrices_to_vec(self, matrices):
         """Converts an iterable of matrices to a vector by reshaping them.
@@ -224,17 +608,18 @@ class MatrixEvolver(VectorEvolver):
             matrices: The matrices to flatten and concat to a single vector.
                 
         Returns:
-            The newly created vector from matrices.
+            The newly created vector of packed uint64 words.
         """
 
-        vec = np.zeros(self._total_params)
-        idx = 0
+        # Matrices produced by vec_to_matrices are views into one flat
+        # buffer, which can be packed directly without reassembling it.
+        base = matrices[0].base if len(matrices) > 0 else None
+        if (base is not None
+                and base.size == self._total_params
+                and all(m.base is base for m in matrices)):
+            return self.pack(base)
 
-        for i, s in enumerate(self._matrix_params):
-            vec[idx : idx + s] = matrices[i][:]
-            idx += s
-
-        return vec
+        return self.pack(np.concatenate([np.ravel(m) for m in matrices]))
 
     def spawn_child(self):
         """Creates a new set of child matrices by first spawning a vector and
@@ -245,7 +630,36 @@ class MatrixEvolver(VectorEvolver):
             
         """
 
-        return self.vec_to_matrices(super().spawn_child())
+        return self.spawn_children(1)[0]
+
+    def spawn_children(self, n: int):
+        """Creates a batch of children, each a set of matrices, by spawning
+        child vectors in bulk and converting each to matrix form.
+
+        Args:
+            n: The number of children to create.
+
+        Returns:
+            A list of n children where each child is a set of matrices.
+
+        """
+
+        return [self.vec_to_matrices(vec) for vec in super().spawn_children(n)]
+
+    def cuda_spawn_children(self, n: int):
+        """Creates a batch of children on the GPU when available, each
+        converted to matrix form.
+
+        Args:
+            n: The number of children to create.
+
+        Returns:
+            A list of n children where each child is a set of matrices.
+
+        """
+
+        return [self.vec_to_matrices(vec)
+                for vec in super().cuda_spawn_children(n)]
 
     def add_child(self, child, priority):
         """Appends a matrix to the set of tracked children with the provided
@@ -253,9 +667,9 @@ class MatrixEvolver(VectorEvolver):
         offspring in each generation.
         
         Returns:
-            A pointer to the entry containing the matrices and corresponding
-            priority.
-            
+            The index of the parent slot the child was retained in, or None
+            if the child was outranked by the retained children.
+
         """
 
         return super().add_child(self.matrices_to_vec(child), priority)
@@ -0,0 +1,28 @@
+import numpy as np
+
+from evolver import CrossoverType, MutationType, VectorEvolver
+
+
+def test_init_child_is_not_all_zeros():
+    # Regression test: a half-open [0, 1) sampling range used to make every
+    # initial genome all zeros.
+    evolver = VectorEvolver(512, CrossoverType.UNIFORM, MutationType.FLIP_BIT,
+                            seed=0)
+    bits = evolver.unpack(evolver.init_child())
+    assert bits.sum() > 0
+
+
+def test_pack_unpack_round_trip():
+    for size in [1, 63, 64, 65, 1000]:
+        evolver = VectorEvolver(size, CrossoverType.UNIFORM,
+                                MutationType.FLIP_BIT, seed=0)
+        bits = (np.arange(size) % 2).astype(np.uint8)
+        assert np.array_equal(evolver.unpack(evolver.pack(bits)), bits)
+
+
+def test_spawn_children_shape():
+    evolver = VectorEvolver(100, CrossoverType.UNIFORM, MutationType.FLIP_BIT,
+                            seed=0)
+    children = evolver.spawn_children(5)
+    assert children.shape == (5, (100 + 63) // 64)
+    assert children.dtype == np.uint64